@@ -1,13 +1,37 @@
 import streamlit as st
 import boto3
+from botocore.config import Config
 import json
 import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import date, datetime, timedelta
 import os
+import queue
 import re
 import sys
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+    
+    # orjson reads integers past 64 bits as floats and rejects the NaN/Infinity
+    # tokens json.dump writes, so documents that may hold either (a 20+ digit
+    # run or a negative 19-digit one, or an orjson decode error) go through
+    # the stdlib parser instead
+    _LONG_DIGITS_RE = re.compile(rb'-\d{19}|\d{20}')
+    
+    def _loads(data):
+        if _LONG_DIGITS_RE.search(data):
+            return json.loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+except ImportError:
+    _loads = json.loads
+
 # Add scripts directory to path for imports
 SCRIPT_DIR = Path(__file__).parent / "scripts"
 sys.path.insert(0, str(SCRIPT_DIR))
@@ -17,10 +41,8 @@ USE_LOCAL_DATA = os.getenv('USE_LOCAL_DATA', 'false').lower() == 'true'
 LOCAL_DATA_PATH = os.getenv('LOCAL_DATA_PATH', 'local_data')
 S3_BUCKET = os.getenv('S3_BUCKET_NAME', 'transaction-logs-overart')
 AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
-
-# Initialize S3 client (only if not using local data)
-if not USE_LOCAL_DATA:
-    s3 = boto3.client('s3', region_name=AWS_REGION)
+S3_FETCH_WORKERS = 32
+LOCAL_READ_WORKERS = 16
 
 st.set_page_config(
     page_title="Transaction Log Viewer",
@@ -28,82 +50,160 @@ st.set_page_config(
     layout="wide"
 )
 
-def convert_raw_transactions():
+@st.cache_resource(show_spinner=False)
+def get_s3_client():
+    """
+    Create the S3 client once per process instead of on every rerun.
+    Connection pool is sized above S3_FETCH_WORKERS so parallel GETs never
+    queue, and TCP keepalive lets them reuse connections.
+    """
+    return boto3.client('s3', config=Config(
+        region_name=AWS_REGION,
+        max_pool_connections=64,
+        retries={'max_attempts': 3, 'mode': 'adaptive'},
+        tcp_keepalive=True,
+        signature_version='s3v4',
+    ))
+
+# Initialize S3 client (only if not using local data)
+if not USE_LOCAL_DATA:
+    s3 = get_s3_client()
+
+def read_raw_file(raw_txt_file):
+    """
+    Read the raw transactions file as bytes and count its transactions.
+    Held in st.session_state per file version (mtime/size), so reruns reuse
+    the buffer and count instead of re-reading and re-scanning the file.
+    
+    Returns:
+        Tuple of ((mtime_ns, size), content bytes, transaction count)
+    """
+    stat = raw_txt_file.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    
+    raw_file = st.session_state.get('raw_file')
+    if raw_file is None or raw_file[0] != version:
+        with open(raw_txt_file, 'rb') as f:
+            content = f.read()
+        raw_file = (version, content, content.count(b'Transaction['))
+        st.session_state['raw_file'] = raw_file
+    
+    return raw_file
+
+
+@st.cache_resource(max_entries=1, ttl=300)
+def parse_raw_transactions(path_str, mtime_ns, size, _content):
+    """
+    Parse the raw transactions file contents.
+    Keyed on the file's path, mtime and size (_content is not hashed) so
+    retrying a partly failed conversion doesn't re-parse an unchanged file.
+    Only the latest version is kept, and only briefly: a fully converted
+    file is skipped via its stamp and never parsed again.
+    """
+    from parse_transaction_text import parse_multiple_transactions
+    
+    return parse_multiple_transactions(_content.decode('utf-8').strip())
+
+
+def convert_raw_transactions(raw_file):
     """
     Convert raw transaction data from .txt file to S3 format.
     Called automatically when refreshing data.
-    """
-    try:
-        from parse_transaction_text import parse_multiple_transactions
-    except ImportError:
-        st.warning("Parser module not found. Raw data conversion disabled.")
-        return 0
     
+    Args:
+        raw_file: Result of read_raw_file(), or None if there is no raw file
+    """
     raw_txt_file = Path(LOCAL_DATA_PATH) / "raw_transactions.txt"
     output_base = Path(LOCAL_DATA_PATH) / "logs"
+    stamp_file = output_base / ".raw_transactions.stamp"
     
-    if not raw_txt_file.exists():
+    if raw_file is None:
         return 0  # No raw file to process
     
-    # Read raw data
-    with open(raw_txt_file, 'r') as f:
-        content = f.read().strip()
-    
-    if not content:
-        return 0  # Empty file
+    (mtime_ns, size), content, tx_count = raw_file
     
     # Check if it's text format (contains Transaction[)
-    if 'Transaction[' not in content:
-        return 0  # Not text format, skip
+    if tx_count == 0:
+        return 0  # Empty file or not text format, skip
+    
+    # Skip entirely if this exact file version was already written out
+    stamp = f"{mtime_ns} {size}"
+    if stamp_file.exists() and stamp_file.read_text() == stamp:
+        return 0
     
     # Parse transactions
-    transactions = parse_multiple_transactions(content)
+    try:
+        from convert_raw_to_local import (
+            append_transaction, load_seen_ids, parse_timestamp, record_seen_ids, sanitize_id,
+        )
+        transactions = parse_raw_transactions(str(raw_txt_file), mtime_ns, size, content)
+    except ImportError:
+        st.warning("Parser module not found. Raw data conversion disabled.")
+        return 0
     
     if not transactions:
         return 0
     
+    # Only write transactions whose IDs aren't already in the logs
+    seen_ids = load_seen_ids(output_base)
+    new_ids = []
+    
     converted = 0
+    rejected = 0  # Bad records: re-parsing the same file won't fix them
+    failed = 0  # Write errors: worth retrying on the next Refresh
     for transaction in transactions:
         try:
             # Ensure required fields
             if 'timestamp' not in transaction:
+                rejected += 1
                 continue
             if 'transaction_id' not in transaction:
+                rejected += 1
+                continue
+            
+            safe_id = sanitize_id(transaction['transaction_id'])
+            if safe_id in seen_ids:
                 continue
             
-            # Parse timestamp
-            timestamp_str = transaction['timestamp']
+            # Parse timestamp (null or all-digit values don't parse to a str)
+            timestamp = transaction['timestamp']
+            if not isinstance(timestamp, str):
+                rejected += 1
+                continue
             try:
-                # Try different formats
-                for fmt in ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"]:
-                    try:
-                        dt = datetime.strptime(timestamp_str.replace('+00:00', '').replace('Z', ''), fmt.replace('Z', ''))
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            except:
+                dt = parse_timestamp(timestamp)
+            except ValueError:
+                rejected += 1
                 continue
             
             # Create directory structure
             date_dir = output_base / dt.strftime("%Y") / dt.strftime("%m") / dt.strftime("%d")
             date_dir.mkdir(parents=True, exist_ok=True)
             
-            # Sanitize ID for filename
-            transaction_id = transaction['transaction_id']
-            safe_id = "".join(c if c.isalnum() or c in '-_' else '_' for c in str(transaction_id))
-            filename = f"transaction_{safe_id}.json"
-            filepath = date_dir / filename
-            
-            # Save transaction
-            with open(filepath, 'w') as f:
-                json.dump(transaction, f, indent=2)
+            # Save transaction to the day's JSONL file
+            append_transaction(date_dir, transaction)
+            seen_ids.add(safe_id)
+            new_ids.append(safe_id)
             
             converted += 1
         except Exception as e:
+            failed += 1
             continue
     
+    record_seen_ids(output_base, new_ids)
+    
+    if rejected:
+        st.sidebar.warning(f"⚠️ {rejected} transaction(s) skipped: missing or invalid timestamp/transaction_id")
+    
+    if failed:
+        # Leave the file version unstamped so the next Refresh retries these
+        st.sidebar.warning(f"⚠️ {failed} transaction(s) could not be converted")
+        return converted
+    
+    # Mark this file version as materialized
+    output_base.mkdir(parents=True, exist_ok=True)
+    stamp_file.write_text(stamp)
+    
     return converted
 
 
@@ -112,7 +212,44 @@ if USE_LOCAL_DATA:
     st.info("🔧 Running in LOCAL MODE - Using local data files")
 st.markdown("---")
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+def log_sort_key(log):
+    """Sort key for ordering logs by timestamp; missing timestamps sort oldest."""
+    return str(log.get('timestamp') or '')
+
+def read_log_file(path):
+    """
+    Read one local log file and return its transactions.
+    Returns an empty list if the file can't be read or parsed.
+    """
+    try:
+        if path.endswith('.jsonl'):
+            # Later lines win, matching the old overwrite-by-filename behaviour
+            by_id = {}
+            with open(path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        log_entry = _loads(line)
+                    except ValueError:
+                        continue  # Skip invalid lines
+                    if not isinstance(log_entry, dict):
+                        continue  # Valid JSON but not a transaction object
+                    by_id[log_entry.get('transaction_id')] = log_entry
+            return list(by_id.values())
+        
+        # Whole-file read: skip the buffered wrapper and str decode
+        with open(path, 'rb', buffering=0) as f:
+            log_entry = _loads(f.read())
+        return [log_entry] if isinstance(log_entry, dict) else []
+    except (ValueError, IOError):
+        # Skip invalid files
+        return []
+
+# Loaders use cache_resource: cache_data would pickle the logs (raw_text and
+# json_* blobs included) on store and unpickle a fresh copy on every rerun.
+# The returned list is shared, so callers must treat it as read-only.
+@st.cache_resource(ttl=300)  # Cache for 5 minutes
 def load_logs_from_local(date_filter=None):
     """Load transaction logs from local file system"""
     logs = []
@@ -132,30 +269,114 @@ def load_logs_from_local(date_filter=None):
             # Get logs from last 7 days
             search_paths = []
             for i in range(7):
-                date = datetime.now() - timedelta(days=i)
-                date_path = base_path / date.strftime('%Y/%m/%d')
+                day = datetime.now() - timedelta(days=i)
+                date_path = base_path / day.strftime('%Y/%m/%d')
                 if date_path.exists():
                     search_paths.append(date_path)
         
-        # Walk through directories and load JSON files
-        for search_path in search_paths:
-            if search_path.exists():
-                for json_file in search_path.glob('*.json'):
-                    try:
-                        with open(json_file, 'r') as f:
-                            log_entry = json.load(f)
-                            logs.append(log_entry)
-                    except (json.JSONDecodeError, IOError) as e:
-                        # Skip invalid files
-                        continue
+        # Collect log files first:
+        # - transactions.jsonl: one transaction per line (written by the converter)
+        # - *.json: one transaction per file (older converted data)
+        # os.scandir avoids a Path object and fnmatch per entry
+        log_paths = [
+            entry.path
+            for search_path in search_paths
+            for entry in os.scandir(search_path)
+            if entry.name.endswith('.jsonl') or entry.name.endswith('.json')
+        ]
+        
+        # Then read them on a small pool so open/read syscalls overlap
+        # (the GIL is released during file I/O).
+        # Logs converted before the JSONL switch can also be in a day's
+        # transactions.jsonl, so de-duplicate by ID across files: the .jsonl
+        # copy wins over a per-transaction .json file
+        by_id = {}
+        with ThreadPoolExecutor(max_workers=LOCAL_READ_WORKERS) as executor:
+            for path, entries in zip(log_paths, executor.map(read_log_file, log_paths)):
+                from_jsonl = path.endswith('.jsonl')
+                for log_entry in entries:
+                    transaction_id = log_entry.get('transaction_id')
+                    if transaction_id is None:
+                        logs.append(log_entry)
+                    elif from_jsonl:
+                        by_id[transaction_id] = log_entry
+                    else:
+                        by_id.setdefault(transaction_id, log_entry)
+        logs.extend(by_id.values())
         
+        # Newest first; sorted here so it runs once per cache fill, not per rerun
+        logs.sort(key=log_sort_key, reverse=True)
         return logs
     
     except Exception as e:
         st.error(f"Error loading logs from local files: {str(e)}")
         return []
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+def list_log_pages(prefix):
+    """
+    Yield raw ListObjectsV2 responses for `prefix`.
+    Calls the client directly with a continuation token instead of going
+    through the paginator wrapper. No Delimiter is passed, so the listing is
+    flat and returns up to 1000 keys per round-trip.
+    """
+    token = None
+    while True:
+        kwargs = {'Bucket': S3_BUCKET, 'Prefix': prefix, 'MaxKeys': 1000}
+        if token:
+            kwargs['ContinuationToken'] = token
+        response = s3.list_objects_v2(**kwargs)
+        yield response
+        if not response.get('IsTruncated'):
+            break
+        token = response['NextContinuationToken']
+
+_PREFETCH_DONE = object()
+
+def prefetch_pages(pages):
+    """
+    Iterate over S3 listing pages while a background thread fetches the next one.
+    ListObjectsV2 is continuation-token based and inherently serial, but the
+    round-trip for page N+1 can overlap with processing page N.
+    Close the generator if you stop early, so the thread is told to exit
+    rather than staying blocked on the full queue.
+    """
+    page_queue = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    
+    def put(item):
+        """Queue item unless the consumer has gone away; returns whether it was queued."""
+        while not stop.is_set():
+            try:
+                page_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def fetch():
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+        except Exception as e:
+            put((None, e))
+            return
+        put((_PREFETCH_DONE, None))
+    
+    threading.Thread(target=fetch, daemon=True).start()
+    
+    try:
+        while True:
+            page, error = page_queue.get()
+            if error is not None:
+                raise error
+            if page is _PREFETCH_DONE:
+                return
+            yield page
+    finally:
+        stop.set()
+
+@st.cache_resource(ttl=300)  # Cache for 5 minutes
 def load_logs_from_s3(date_filter=None):
     """Load transaction logs from S3
     
@@ -176,46 +397,57 @@ def load_logs_from_s3(date_filter=None):
             # Get logs from last 7 days
             prefix = "logs/"
         
-        # List objects in S3
-        paginator = s3.get_paginator('list_objects_v2')
-        pages = paginator.paginate(Bucket=S3_BUCKET, Prefix=prefix)
-        
-        for page in pages:
-            if 'Contents' not in page:
-                continue
+        def fetch_log(key):
+            """
+            Fetch and parse a single S3 object.
+            Runs on a worker thread, so problems are returned as a warning
+            message for the caller to display instead of calling st.warning.
+            """
+            try:
+                # Get object content
+                response = s3.get_object(Bucket=S3_BUCKET, Key=key)
+                content = response['Body'].read()
                 
-            for obj in page['Contents']:
+                if key.endswith('.txt'):
+                    # Parse raw text file on-the-fly
+                    parsed = parse_transaction_text(content.decode('utf-8').strip())
+                    if parsed:
+                        return parsed, None
+                    # Log parsing failure but continue
+                    return None, f"Failed to parse transaction from {key}"
+                
+                # Load JSON file (existing behavior for backward compatibility)
+                # Bytes go straight to the parser, no intermediate str decode
+                return _loads(content), None
+            
+            except ValueError as e:
+                # Invalid JSON file - skip it (covers orjson and stdlib decode errors)
+                return None, f"Invalid JSON in {key}: {str(e)}"
+            except Exception as e:
+                # Other errors (parsing, network, etc.) - skip this file
+                return None, f"Error processing {key}: {str(e)}"
+        
+        # List objects in S3
+        # closing() stops the prefetch thread if the loop exits early (e.g. st.warning
+        # raising Streamlit's rerun/stop signal)
+        with ThreadPoolExecutor(max_workers=S3_FETCH_WORKERS) as executor, \
+                closing(prefetch_pages(list_log_pages(prefix))) as pages:
+            for page in pages:
                 # Accept both .txt (raw text) and .json (pre-parsed) files
-                if not (obj['Key'].endswith('.json') or obj['Key'].endswith('.txt')):
-                    continue
+                keys = [
+                    obj['Key'] for obj in page.get('Contents', ())
+                    if obj['Key'].endswith('.json') or obj['Key'].endswith('.txt')
+                ]
                 
-                try:
-                    # Get object content
-                    response = s3.get_object(Bucket=S3_BUCKET, Key=obj['Key'])
-                    content = response['Body'].read().decode('utf-8')
-                    
-                    if obj['Key'].endswith('.txt'):
-                        # Parse raw text file on-the-fly
-                        parsed = parse_transaction_text(content.strip())
-                        if parsed:
-                            logs.append(parsed)
-                        else:
-                            # Log parsing failure but continue
-                            st.warning(f"Failed to parse transaction from {obj['Key']}")
-                    else:
-                        # Load JSON file (existing behavior for backward compatibility)
-                        log_entry = json.loads(content)
+                # GETs are network-bound; fan them out and keep listing order
+                for log_entry, warning in executor.map(fetch_log, keys):
+                    if warning:
+                        st.warning(warning)
+                    elif log_entry is not None:
                         logs.append(log_entry)
-                        
-                except json.JSONDecodeError as e:
-                    # Invalid JSON file - skip it
-                    st.warning(f"Invalid JSON in {obj['Key']}: {str(e)}")
-                    continue
-                except Exception as e:
-                    # Other errors (parsing, network, etc.) - skip this file
-                    st.warning(f"Error processing {obj['Key']}: {str(e)}")
-                    continue
         
+        # Newest first; sorted here so it runs once per cache fill, not per rerun
+        logs.sort(key=log_sort_key, reverse=True)
         return logs
     
     except Exception as e:
@@ -231,15 +463,19 @@ date_option = st.sidebar.radio(
     ["Today", "Yesterday", "Last 7 Days", "Custom Date"]
 )
 
+# Plain dates (not datetime.now()) so the loaders' cache key only changes
+# when the selected day does, not on every rerun
 date_filter = None
 if date_option == "Today":
-    date_filter = datetime.now()
+    date_filter = date.today()
 elif date_option == "Yesterday":
-    date_filter = datetime.now() - timedelta(days=1)
+    date_filter = date.today() - timedelta(days=1)
 elif date_option == "Custom Date":
     date_filter = st.sidebar.date_input("Select Date")
-    if isinstance(date_filter, datetime.date):
-        date_filter = datetime.combine(date_filter, datetime.min.time())
+
+# Read the raw file once per rerun (local mode); shared by Refresh and the status line
+raw_txt_file = Path(LOCAL_DATA_PATH) / "raw_transactions.txt"
+raw_file = read_raw_file(raw_txt_file) if USE_LOCAL_DATA and raw_txt_file.exists() else None
 
 # Refresh button - at top for visibility
 st.sidebar.markdown("---")
@@ -247,21 +483,19 @@ if st.sidebar.button("🔄 Refresh & Convert Data"):
     # Convert raw transactions first (if local mode)
     if USE_LOCAL_DATA:
         with st.spinner("Converting raw transactions..."):
-            converted = convert_raw_transactions()
+            converted = convert_raw_transactions(raw_file)
             if converted > 0:
                 st.sidebar.success(f"✓ Converted {converted} transaction(s)")
     
-    # Clear cache and rerun
-    st.cache_data.clear()
+    # Clear cached logs and rerun
+    load_logs_from_local.clear()
+    load_logs_from_s3.clear()
     st.rerun()
 
 # Show raw file status in local mode
 if USE_LOCAL_DATA:
-    raw_txt_file = Path(LOCAL_DATA_PATH) / "raw_transactions.txt"
-    if raw_txt_file.exists():
-        with open(raw_txt_file, 'r') as f:
-            content = f.read()
-        tx_count = content.count('Transaction[')
+    if raw_file is not None:
+        tx_count = raw_file[2]
         st.sidebar.info(f"📄 raw_transactions.txt: {tx_count} transaction(s) found")
     else:
         st.sidebar.warning("📄 No raw_transactions.txt file found")
@@ -279,7 +513,14 @@ if not logs:
     st.stop()
 
 # Convert to DataFrame
-df = pd.DataFrame(logs)
+# Only the columns used for filtering/display; raw_text/json_* blobs stay out
+# of pandas and the detail view looks transactions up by ID instead
+DISPLAY_FIELDS = ('timestamp', 'transaction_id', 'status', 'amount')
+df = pd.DataFrame([{k: log[k] for k in DISPLAY_FIELDS if k in log} for log in logs])
+
+logs_by_id = {}
+for log in logs:
+    logs_by_id.setdefault(log.get('transaction_id'), log)
 
 # Transaction ID search
 search_id = st.sidebar.text_input("🔍 Search Transaction ID:")
@@ -294,6 +535,9 @@ if 'status' in df.columns:
         df = df[df['status'] == status_filter]
 
 # Display metrics
+# One pass over the status column instead of a boolean mask per status
+status_counts = df['status'].value_counts() if 'status' in df.columns else pd.Series(dtype=int)
+
 col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
@@ -301,18 +545,15 @@ with col1:
 
 with col2:
     if 'status' in df.columns:
-        success_count = len(df[df['status'] == 'success'])
-        st.metric("Successful", success_count)
+        st.metric("Successful", int(status_counts.get('success', 0)))
 
 with col3:
     if 'status' in df.columns:
-        pending_count = len(df[df['status'] == 'pending'])
-        st.metric("Pending", pending_count)
+        st.metric("Pending", int(status_counts.get('pending', 0)))
 
 with col4:
     if 'status' in df.columns:
-        failed_count = len(df[df['status'] == 'failed'])
-        st.metric("Failed", failed_count)
+        st.metric("Failed", int(status_counts.get('failed', 0)))
 
 with col5:
     if 'amount' in df.columns:
@@ -331,7 +572,7 @@ if 'amount' in df.columns:
 
 # Format and display
 st.dataframe(
-    df[display_columns].sort_values('timestamp', ascending=False),
+    df[display_columns],  # Already newest first from the loader
     use_container_width=True,
     height=400
 )
@@ -340,13 +581,20 @@ st.dataframe(
 st.markdown("---")
 st.subheader("Detailed Transaction View")
 
+# logs_by_id already holds the unique IDs in order; only a filtered frame
+# (search/status removed rows) needs its own de-duplicated list
+if len(df) == len(logs):
+    transaction_ids = list(logs_by_id)
+else:
+    transaction_ids = df['transaction_id'].drop_duplicates().tolist()
+
 selected_id = st.selectbox(
     "Select Transaction ID for Details:",
-    options=df['transaction_id'].unique()
+    options=transaction_ids
 )
 
 if selected_id:
-    selected_tx = df[df['transaction_id'] == selected_id].iloc[0].to_dict()
+    selected_tx = logs_by_id[selected_id]
     
     # Check if we have the three representations
     has_representations = all(k in selected_tx for k in ['raw_text', 'json_full', 'json_compact'])
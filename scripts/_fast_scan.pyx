@@ -0,0 +1,91 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled versions of the top-level field/item splitters used by
+parse_transaction_text.py.
+
+Walks the string with a native index and bracket depth and only creates
+Python strings at field boundaries. Behaviour matches _split_fields_py and
+_split_items_py exactly; the parser falls back to those when this module
+hasn't been built.
+
+Build in place (requires Cython and a C compiler):
+    cythonize -i scripts/_fast_scan.pyx
+"""
+
+
+cdef inline void _add_pair(list pairs, str content, Py_ssize_t field_start, Py_ssize_t field_end,
+                           Py_ssize_t value_start, Py_ssize_t end, bint in_field):
+    cdef str field_name
+    cdef str value
+    if in_field:
+        # No '=' seen: the whole segment is the field name and the value is empty
+        field_name = content[field_start:end].strip()
+        value = ''
+    else:
+        field_name = content[field_start:field_end].strip()
+        value = content[value_start:end].strip()
+    if field_name:
+        pairs.append((field_name, value))
+
+
+def split_fields(str content):
+    """Split content into (field_name, value) string pairs at top-level commas."""
+    cdef list pairs = []
+    cdef Py_ssize_t n = len(content)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t field_start = 0, field_end = 0, value_start = 0
+    cdef int depth = 0
+    cdef bint in_field = True
+    cdef Py_UCS4 ch
+    
+    for i in range(n):
+        ch = content[i]
+        if ch == u'[' or ch == u'{':
+            depth += 1
+        elif ch == u']' or ch == u'}':
+            depth -= 1
+        elif depth == 0:
+            if ch == u'=':
+                if in_field:
+                    field_end = i
+                    value_start = i + 1
+                    in_field = False
+            elif ch == u',':
+                _add_pair(pairs, content, field_start, field_end, value_start, i, in_field)
+                field_start = i + 1
+                in_field = True
+    
+    # Don't forget the last field
+    _add_pair(pairs, content, field_start, field_end, value_start, n, in_field)
+    
+    return pairs
+
+
+def split_items(str content):
+    """Split array content into item strings at top-level commas; empty items are dropped."""
+    cdef list items = []
+    cdef Py_ssize_t n = len(content)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t item_start = 0
+    cdef int depth = 0
+    cdef Py_UCS4 ch
+    cdef str item
+    
+    for i in range(n):
+        ch = content[i]
+        if ch == u'[' or ch == u'{':
+            depth += 1
+        elif ch == u']' or ch == u'}':
+            depth -= 1
+        elif depth == 0 and ch == u',':
+            item = content[item_start:i].strip()
+            if item:
+                items.append(item)
+            item_start = i + 1
+    
+    # Don't forget the last item
+    item = content[item_start:].strip()
+    if item:
+        items.append(item)
+    
+    return items
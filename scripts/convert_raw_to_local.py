@@ -6,14 +6,29 @@ This script reads raw transaction data from:
 - local_data/raw_transactions.json (JSON format)
 - local_data/raw_transactions.txt (Text format - Java/Kotlin object strings)
 
-And converts it to the S3 log format, saving files in local_data/logs/YYYY/MM/DD/
+And converts it to the S3 log format, appending to local_data/logs/YYYY/MM/DD/transactions.jsonl
 """
 
 import json
 import os
-from datetime import datetime
+import re
+import sys
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+try:
+    import orjson
+    def dumps_line(obj):
+        try:
+            return orjson.dumps(obj) + b'\n'
+        except orjson.JSONEncodeError:
+            # orjson only encodes 64-bit ints; the parser turns long all-digit
+            # references into bigger ones, which the stdlib encoder handles
+            return json.dumps(obj).encode('utf-8') + b'\n'
+except ImportError:
+    def dumps_line(obj):
+        return json.dumps(obj).encode('utf-8') + b'\n'
+
 # Import the text parser
 from parse_transaction_text import parse_transaction_text, parse_multiple_transactions
 
@@ -23,30 +38,90 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 RAW_JSON_FILE = PROJECT_ROOT / "local_data" / "raw_transactions.json"
 RAW_TEXT_FILE = PROJECT_ROOT / "local_data" / "raw_transactions.txt"
 OUTPUT_BASE = PROJECT_ROOT / "local_data" / "logs"
+LOG_FILENAME = "transactions.jsonl"  # One append-only file per day
+SEEN_IDS_FILENAME = "_seen_ids.txt"  # Sanitized IDs already written to the logs
+
+
+# Hot-path timestamp shapes: YYYY-MM-DD, optional [T ]HH:MM:SS[.ffffff], optional Z/offset
+TIMESTAMP_PATTERN = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?)?$'
+)
+
+# Slow-path strptime formats for timestamps the regex and ISO parser reject
+FALLBACK_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+
+# Python 3.11+ fromisoformat is a C parser that accepts full ISO 8601 (incl. 'Z')
+FROMISOFORMAT_IS_FULL_ISO = sys.version_info >= (3, 11)
 
 
 def parse_timestamp(timestamp_str):
     """Parse timestamp string to datetime object."""
-    # Try different timestamp formats
-    formats = [
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-    ]
-    
-    for fmt in formats:
+    # On 3.11+ a single fromisoformat call covers every shape the regex does;
+    # on failure fall through, since the strptime formats below accept more
+    if FROMISOFORMAT_IS_FULL_ISO:
+        try:
+            return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        except ValueError:
+            pass
+    
+    # Build the datetime straight from regex groups; no strptime format probing
+    match = TIMESTAMP_PATTERN.match(timestamp_str)
+    if match:
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+        try:
+            dt = datetime(
+                int(year), int(month), int(day),
+                int(hour or 0), int(minute or 0), int(second or 0),
+                int((fraction or '0')[:6].ljust(6, '0')),
+            )
+            if offset and offset != 'Z':
+                sign = -1 if offset[0] == '-' else 1
+                hours, minutes = int(offset[1:3]), int(offset[-2:])
+                dt = dt.replace(tzinfo=timezone(sign * timedelta(hours=hours, minutes=minutes)))
+            elif offset:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return dt
+        except ValueError:
+            pass
+    
+    # Anything else goes to the ISO format parser (already tried above on 3.11+)
+    if not FROMISOFORMAT_IS_FULL_ISO:
+        try:
+            return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        except ValueError:
+            pass
+    
+    # Last resort: strptime also takes unpadded fields (e.g. 2025-1-5, T2:3:4)
+    for fmt in FALLBACK_FORMATS:
         try:
             return datetime.strptime(timestamp_str, fmt)
         except ValueError:
             continue
     
-    # If all formats fail, try ISO format parser
-    try:
-        return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-    except:
-        raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
+    raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
+
+
+# ASCII characters that aren't safe in a filename map to '_'
+SAFE_ID_TABLE = str.maketrans({
+    chr(i): '_' for i in range(128) if not (chr(i).isalnum() or chr(i) in '-_')
+})
+
+
+def sanitize_id(transaction_id):
+    """Sanitize a transaction ID for use in a filename."""
+    safe_id = str(transaction_id).translate(SAFE_ID_TABLE)
+    # The table only covers ASCII; non-ASCII IDs still need the per-char check
+    if not safe_id.isascii():
+        safe_id = "".join(c if c.isalnum() or c in '-_' else '_' for c in safe_id)
+    return safe_id
 
 
 def extract_transaction_id(transaction):
@@ -78,6 +153,54 @@ def ensure_required_fields(transaction):
     return transaction
 
 
+def scan_converted_ids(output_base):
+    """Collect sanitized IDs from the logs already under output_base."""
+    seen_ids = set()
+    # Per-transaction files written before the switch to JSONL
+    for path in output_base.glob("*/*/*/transaction_*.json"):
+        seen_ids.add(path.stem[len("transaction_"):])
+    for path in output_base.glob(f"*/*/*/{LOG_FILENAME}"):
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    transaction = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Skip invalid lines
+                if isinstance(transaction, dict) and 'transaction_id' in transaction:
+                    seen_ids.add(sanitize_id(transaction['transaction_id']))
+    return seen_ids
+
+
+def load_seen_ids(output_base):
+    """Load the set of sanitized transaction IDs already written under output_base."""
+    index_path = output_base / SEEN_IDS_FILENAME
+    if not index_path.exists():
+        # No index yet (fresh install, or logs from an older converter):
+        # seed it from the existing logs so they aren't written again
+        seen_ids = scan_converted_ids(output_base)
+        record_seen_ids(output_base, sorted(seen_ids))
+        return seen_ids
+    with open(index_path, 'r') as f:
+        return set(f.read().splitlines())
+
+
+def record_seen_ids(output_base, safe_ids):
+    """Append newly written sanitized transaction IDs to the seen-ID index."""
+    if not safe_ids:
+        return
+    output_base.mkdir(parents=True, exist_ok=True)
+    with open(output_base / SEEN_IDS_FILENAME, 'a') as f:
+        f.write("".join(f"{safe_id}\n" for safe_id in safe_ids))
+
+
+def append_transaction(date_dir, transaction):
+    """Append a transaction as one line of the day's JSONL log file."""
+    filepath = date_dir / LOG_FILENAME
+    with open(filepath, 'ab') as f:
+        f.write(dumps_line(transaction))
+    return filepath
+
+
 def convert_transaction(transaction, output_base):
     """Convert a single transaction to S3 format and save it."""
     # Ensure required fields
@@ -95,59 +218,64 @@ def convert_transaction(transaction, output_base):
     date_dir = output_base / dt.strftime("%Y") / dt.strftime("%m") / dt.strftime("%d")
     date_dir.mkdir(parents=True, exist_ok=True)
     
-    # Get transaction ID
-    transaction_id = transaction['transaction_id']
-    
-    # Create filename (sanitize ID for filename)
-    safe_id = "".join(c if c.isalnum() or c in '-_' else '_' for c in str(transaction_id))
-    filename = f"transaction_{safe_id}.json"
-    filepath = date_dir / filename
-    
-    # Save transaction as JSON
-    with open(filepath, 'w') as f:
-        json.dump(transaction, f, indent=2)
-    
-    return filepath
+    # Save transaction to the day's JSONL file
+    return append_transaction(date_dir, transaction)
 
 
 def detect_format(content):
     """
     Detect if content is JSON or text format.
     
+    Only looks at the leading character and the 'Transaction[' marker; the
+    content is parsed here only when those are inconclusive or disagree, and
+    that result is handed back so load_json_data doesn't parse it a second time.
+    
     Returns:
-        'json' if content appears to be JSON
-        'text' if content appears to be text format (Java/Kotlin object string)
+        Tuple of (format, parsed):
+        format is 'json' if content appears to be JSON,
+        'text' if content appears to be text format (Java/Kotlin object string);
+        parsed is the decoded JSON value if detection parsed it, else None
     """
     content = content.strip()
     
-    # If it starts with [ or {, it's likely JSON
-    if content.startswith('[') or content.startswith('{'):
+    has_marker = 'Transaction[' in content
+    
+    # If it starts with [ or {, it's JSON (or JSONL) unless it has the text
+    # marker too: a list dump like [Transaction[...], ...] or a {...} preamble
+    # is text, while JSON can still carry the marker inside a string
+    if content[:1] in ('[', '{'):
+        if not has_marker:
+            return 'json', None
         try:
-            json.loads(content)
-            return 'json'
+            return 'json', json.loads(content)
         except json.JSONDecodeError:
-            pass
+            return 'text', None
     
     # If it contains "Transaction[" it's text format
-    if 'Transaction[' in content:
-        return 'text'
+    if has_marker:
+        return 'text', None
     
     # Try to parse as JSON anyway
     try:
-        json.loads(content)
-        return 'json'
+        return 'json', json.loads(content)
     except json.JSONDecodeError:
         pass
     
     # Default to text format
-    return 'text'
+    return 'text', None
 
 
-def load_json_data(content):
-    """Load transaction data from JSON format."""
+def load_json_data(content, parsed=None):
+    """
+    Load transaction data from JSON format.
+    
+    Args:
+        content: Raw JSON or JSONL text
+        parsed: Already-decoded JSON value from detect_format, if any
+    """
     # Try to parse as JSON array
     try:
-        data = json.loads(content)
+        data = parsed if parsed is not None else json.loads(content)
     except json.JSONDecodeError:
         # Try JSONL format (one JSON object per line)
         data = []
@@ -171,7 +299,8 @@ def load_json_data(content):
 
 def load_text_data(content):
     """Load transaction data from text format (Java/Kotlin object strings)."""
-    transactions = parse_multiple_transactions(content)
+    # CLI entry point is __main__-guarded, so a process pool is safe here
+    transactions = parse_multiple_transactions(content, workers=os.cpu_count())
     
     if not transactions:
         raise ValueError(
@@ -200,13 +329,13 @@ def load_raw_data():
             content = f.read().strip()
         
         if content:
-            format_type = detect_format(content)
+            format_type, parsed = detect_format(content)
             print(f"Detected format: {format_type}")
             
             if format_type == 'text':
                 return load_text_data(content), RAW_TEXT_FILE
             else:
-                return load_json_data(content), RAW_TEXT_FILE
+                return load_json_data(content, parsed), RAW_TEXT_FILE
     
     # Check for JSON file
     if RAW_JSON_FILE.exists():
@@ -215,13 +344,13 @@ def load_raw_data():
             content = f.read().strip()
         
         if content:
-            format_type = detect_format(content)
+            format_type, parsed = detect_format(content)
             print(f"Detected format: {format_type}")
             
             if format_type == 'text':
                 return load_text_data(content), RAW_JSON_FILE
             else:
-                return load_json_data(content), RAW_JSON_FILE
+                return load_json_data(content, parsed), RAW_JSON_FILE
     
     # No files found
     raise FileNotFoundError(
@@ -252,15 +381,26 @@ def main():
     
     print()
     
-    # Convert each transaction
+    # Convert each transaction, skipping IDs already in the logs
+    seen_ids = load_seen_ids(OUTPUT_BASE)
+    new_ids = []
     converted = 0
+    already_converted = 0
     skipped = 0
     errors = []
     
     for i, transaction in enumerate(transactions, 1):
         try:
+            transaction = ensure_required_fields(transaction)
+            safe_id = sanitize_id(transaction['transaction_id'])
+            if safe_id in seen_ids:
+                already_converted += 1
+                continue
+            
             filepath = convert_transaction(transaction, OUTPUT_BASE)
             if filepath:
+                seen_ids.add(safe_id)
+                new_ids.append(safe_id)
                 converted += 1
                 print(f"  [{i}/{len(transactions)}] Converted: {filepath.relative_to(PROJECT_ROOT)}")
             else:
@@ -270,6 +410,8 @@ def main():
             errors.append(f"Transaction {i}: {e}")
             print(f"  [{i}/{len(transactions)}] Error: {e}")
     
+    record_seen_ids(OUTPUT_BASE, new_ids)
+    
     # Summary
     print()
     print("=" * 60)
@@ -277,6 +419,7 @@ def main():
     print("=" * 60)
     print(f"Total transactions: {len(transactions)}")
     print(f"Successfully converted: {converted}")
+    print(f"Already converted: {already_converted}")
     print(f"Skipped/Errors: {skipped}")
     
     if errors:
@@ -289,7 +432,7 @@ def main():
         print("\nTo use local data, run:")
         print("  USE_LOCAL_DATA=true streamlit run app.py")
     
-    return 0 if converted > 0 else 1
+    return 0 if converted > 0 or already_converted > 0 else 1
 
 
 if __name__ == "__main__":
@@ -11,102 +11,271 @@ Generates three representations:
 - raw_text: Original text as-is
 - json_full: All fields including nulls
 - json_compact: Filtered version without nulls
+
+json_full and json_compact contain only dicts, lists, strings, numbers,
+booleans and None, so they serialize directly with json. orjson also
+works except for integers beyond 64 bits (long all-digit values);
+_dumps below is the indented encoder that uses orjson when installed and
+falls back to json for those.
 """
 
+import functools
+import json
 import re
-from typing import Dict, Any, Optional, List, Union
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields as dataclass_fields
+from typing import Dict, Any, Literal, Optional, List, Tuple, Union
+
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        """Serialize to indented JSON with the orjson C encoder."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # orjson only encodes 64-bit ints; long all-digit values parse to bigger ones
+            return json.dumps(obj, indent=2)
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        """Serialize to indented JSON (stdlib fallback)."""
+        return json.dumps(obj, indent=2)
+
+# Output modes for parse_transaction_text
+ParseMode = Literal['full', 'compact', 'summary']
+PARSE_MODES = ('full', 'compact', 'summary')
+
+# Top-level fields behind the display/filter keys, parsed in 'summary' mode
+SUMMARY_FIELDS = frozenset(('id', 'createdAt', 'updatedAt', 'status', 'amount', 'currency'))
+
+# Minimum batch size before parse_multiple_transactions uses a process pool
+PARALLEL_THRESHOLD = 64
+
+# Precompiled patterns (_parse_once runs once per field/array item). Each is
+# anchored with a single greedy group and no nested quantifiers, so a failed
+# match backtracks at most once over the value: matching stays linear in its
+# length on the stdlib engine
+_VALUE_RE = re.compile(r'^(\w+)\s*\[value=([^\]]+)\]$')
+_OPTIONAL_RE = re.compile(r'^Optional\[(.+)\]$', re.DOTALL)
+_NULLABLE_RE = re.compile(r'^JsonNullable\[(.+)\]$', re.DOTALL)
+_NESTED_RE = re.compile(r'^(\w+)\[(.+)\]$', re.DOTALL)
+_FIELD_DELIM_RE = re.compile(r'[\[\]{}=,]')
+_ARRAY_DELIM_RE = re.compile(r'[\[\]{},]')
+
+# Literal casings that parse to None/True/False without calling lower()
+_NULL_SET = frozenset(('null', 'Null', 'NULL', 'none', 'None', 'NONE'))
+_TRUE_SET = frozenset(('true', 'True', 'TRUE'))
+_FALSE_SET = frozenset(('false', 'False', 'FALSE'))
+
+# (substring, normalized status) pairs checked in order by normalize_status
+_STATUS_KEYWORDS = (
+    ('succeeded', 'success'),
+    ('success', 'success'),
+    ('failed', 'failed'),
+    ('failure', 'failed'),
+    ('pending', 'pending'),
+    ('cancelled', 'cancelled'),
+    ('canceled', 'cancelled'),
+    ('refunded', 'refunded'),
+    ('voided', 'voided'),
+)
 
 
 def parse_value_recursive(value: str) -> Any:
     """
-    Recursively parse a value string into its JSON representation.
+    Parse a value string into its JSON representation.
     Handles nested objects, arrays, and wrapper types.
     Preserves null values as None.
     
+    Despite the name, nesting is handled with an explicit worklist (see
+    _parse_once/_drain) rather than one Python call per level.
+    
     Args:
         value: Raw value string from the transaction
         
     Returns:
         Parsed value (dict, list, string, number, bool, or None)
     """
+    work = []
+    result = _parse_once(value, work)
+    _drain(work)
+    return result
+
+
+# A pending container: (dict or list to fill, split fields or items, type name for '_type')
+_Work = Tuple[Union[Dict[str, Any], List[Any]], list, Optional[str]]
+
+
+def _parse_once(value: str, work: List[_Work]) -> Any:
+    """
+    Parse one level of a value string.
+    
+    Scalars and wrappers resolve immediately. Objects, maps and arrays are
+    returned as empty containers, with their split contents pushed onto
+    work for _drain to fill in.
+    """
     if value is None:
         return None
     
+    # Optional[...]/JsonNullable[...] unwrap by looping rather than recursing
+    while True:
+        # Values without brackets are plain scalars; these repeat a lot across
+        # transactions (currency codes, enum values, zero amounts) so are cached
+        if '[' not in value and '{' not in value:
+            return _parse_scalar(value)
+        
+        value = value.strip()
+        
+        # Handle JsonNullable[null] -> None
+        if value == 'JsonNullable[null]':
+            return None
+        
+        # Handle Optional[null] -> None
+        if value == 'Optional[null]':
+            return None
+        
+        # Handle empty array
+        if value == '[]':
+            return []
+        
+        # Bracketed forms all end in ']'; {...} maps skip the regexes entirely
+        if value[-1] == ']':
+            # Handle TypeName [value=xxx] format (e.g., TransactionStatus [value=authorization_succeeded])
+            if '[value=' in value:
+                value_match = _VALUE_RE.match(value)
+                if value_match:
+                    return value_match.group(2).strip()
+            
+            # Handle Optional[xxx] - unwrap and parse inner value
+            if value.startswith('Optional['):
+                optional_match = _OPTIONAL_RE.match(value)
+                if optional_match:
+                    value = optional_match.group(1)
+                    if value.lower() == 'null':
+                        return None
+                    continue
+            
+            # Handle JsonNullable[xxx] - unwrap and parse inner value
+            if value.startswith('JsonNullable['):
+                nullable_match = _NULLABLE_RE.match(value)
+                if nullable_match:
+                    value = nullable_match.group(1)
+                    if value.lower() == 'null':
+                        return None
+                    continue
+            
+            # Handle nested object with TypeName[...] format (e.g., TransactionBuyer[...])
+            nested_match = _NESTED_RE.match(value)
+            if nested_match:
+                # Only a non-empty field list makes an object; otherwise fall through
+                pairs = _split_fields(nested_match.group(2))
+                if pairs:
+                    parsed_fields = {}
+                    work.append((parsed_fields, pairs, nested_match.group(1)))
+                    return parsed_fields
+        
+        # Handle array with items [..., ...]
+        if value.startswith('[') and value.endswith(']'):
+            inner = value[1:-1].strip()
+            if not inner:
+                return []
+            # Empty item/field lists return at once, so anything queued ends up non-empty
+            parts = _split_items(inner)
+            if not parts:
+                return []
+            items = []
+            work.append((items, parts, None))
+            return items
+        
+        # Handle map/dict format {key=value, ...}
+        if value.startswith('{') and value.endswith('}'):
+            inner = value[1:-1].strip()
+            if not inner:
+                return {}
+            parts = _split_fields(inner)
+            if not parts:
+                return {}
+            parsed_fields = {}
+            work.append((parsed_fields, parts, None))
+            return parsed_fields
+        
+        # Unmatched brackets: return as string
+        return value
+
+
+def _drain(work: List[_Work], skip_nulls: bool = False) -> None:
+    """
+    Fill pending containers until the worklist is empty.
+    
+    Each child is placed in its parent as soon as it is seen (possibly as
+    an empty container queued for later), so key and item order match a
+    depth-first parse regardless of the order work is processed in.
+    
+    With skip_nulls, the containers come out as remove_nulls would leave
+    them, without a second pass over the tree.
+    """
+    while work:
+        container, parts, type_name = work.pop()
+        if container.__class__ is list:
+            append = container.append
+            for item in parts:
+                parsed = _parse_once(item, work)
+                if parsed is not None or not skip_nulls:
+                    append(parsed)
+        elif not skip_nulls:
+            for field_name, value in parts:
+                container[field_name] = _parse_once(value, work)
+            if type_name is not None:
+                # Add the type name (after the fields, so it wins over a '_type' field)
+                container['_type'] = type_name
+        else:
+            # Fields are inserted as usual and dropped afterwards, so duplicate
+            # names and '_type' keep the positions and values a full parse gives
+            droppable = {}
+            for field_name, value in parts:
+                queued = len(work)
+                parsed = _parse_once(value, work)
+                container[field_name] = parsed
+                # Emptiness is judged before filtering, as remove_nulls does: a
+                # queued container is kept even if dropping its nulls empties it
+                droppable[field_name] = parsed is None or (
+                    len(work) == queued and parsed.__class__ in (dict, list) and not parsed)
+            if type_name is not None:
+                container['_type'] = type_name
+                droppable['_type'] = False
+            for field_name, drop in droppable.items():
+                if drop:
+                    del container[field_name]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_scalar(value: str) -> Any:
+    """
+    Parse a value string that contains no brackets.
+    Results are immutable (str, number, bool or None), so they are safe to cache.
+    """
     value = value.strip()
     
     # Handle empty strings
     if value == '':
         return None
     
-    # Handle explicit null values
-    if value.lower() in ['null', 'none']:
+    # Handle explicit null and boolean values; common casings hit the sets
+    # directly, anything else short enough gets a single lower() call
+    if value in _NULL_SET:
         return None
-    
-    # Handle boolean values
-    if value.lower() == 'true':
+    if value in _TRUE_SET:
         return True
-    if value.lower() == 'false':
+    if value in _FALSE_SET:
         return False
-    
-    # Handle JsonNullable[null] -> None
-    if value == 'JsonNullable[null]':
-        return None
-    
-    # Handle Optional[null] -> None
-    if value == 'Optional[null]':
-        return None
-    
-    # Handle empty array
-    if value == '[]':
-        return []
-    
-    # Handle TypeName [value=xxx] format (e.g., TransactionStatus [value=authorization_succeeded])
-    value_match = re.match(r'^(\w+)\s*\[value=([^\]]+)\]$', value)
-    if value_match:
-        return value_match.group(2).strip()
-    
-    # Handle Optional[xxx] - unwrap and parse inner value
-    optional_match = re.match(r'^Optional\[(.+)\]$', value, re.DOTALL)
-    if optional_match:
-        inner = optional_match.group(1)
-        if inner.lower() == 'null':
-            return None
-        return parse_value_recursive(inner)
-    
-    # Handle JsonNullable[xxx] - unwrap and parse inner value
-    nullable_match = re.match(r'^JsonNullable\[(.+)\]$', value, re.DOTALL)
-    if nullable_match:
-        inner = nullable_match.group(1)
-        if inner.lower() == 'null':
+    if len(value) <= 5:
+        value_lower = value.lower()
+        if value_lower in ('null', 'none'):
             return None
-        return parse_value_recursive(inner)
-    
-    # Handle nested object with TypeName[...] format (e.g., TransactionBuyer[...])
-    nested_match = re.match(r'^(\w+)\[(.+)\]$', value, re.DOTALL)
-    if nested_match:
-        type_name = nested_match.group(1)
-        inner_content = nested_match.group(2)
-        # Parse the inner content as fields
-        parsed_fields = parse_fields_from_content(inner_content)
-        if parsed_fields:
-            # Add the type name
-            parsed_fields['_type'] = type_name
-            return parsed_fields
-    
-    # Handle array with items [..., ...]
-    if value.startswith('[') and value.endswith(']'):
-        inner = value[1:-1].strip()
-        if not inner:
-            return []
-        # Parse array items
-        return parse_array_items(inner)
-    
-    # Handle map/dict format {key=value, ...}
-    if value.startswith('{') and value.endswith('}'):
-        inner = value[1:-1].strip()
-        if not inner:
-            return {}
-        return parse_map_items(inner)
+        if value_lower == 'true':
+            return True
+        if value_lower == 'false':
+            return False
     
     # Try to parse as number
     try:
@@ -120,137 +289,142 @@ def parse_value_recursive(value: str) -> Any:
     return value
 
 
-def parse_fields_from_content(content: str) -> Dict[str, Any]:
+def _split_fields_py(content: str) -> List[Tuple[str, str]]:
     """
-    Parse field=value pairs from content string, handling nested brackets.
+    Split content into (field_name, value) string pairs at top-level commas.
     
-    Args:
-        content: String containing field=value pairs
-        
-    Returns:
-        Dictionary of field names to parsed values
+    Jumps between delimiter characters with a regex scan and slices the
+    field names and values out of content, rather than walking and
+    copying it one character at a time.
     """
-    fields = {}
+    pairs = []
     
-    i = 0
-    current_field = ""
-    current_value = ""
+    field_start = 0
+    field_end = 0
+    value_start = 0
     in_field = True
     bracket_depth = 0
     
-    while i < len(content):
-        char = content[i]
+    for match in _FIELD_DELIM_RE.finditer(content):
+        char = match.group()
         
-        if char == '[':
-            bracket_depth += 1
-            if in_field:
-                current_field += char
-            else:
-                current_value += char
-        elif char == ']':
-            bracket_depth -= 1
-            if in_field:
-                current_field += char
-            else:
-                current_value += char
-        elif char == '{':
+        if char in '[{':
             bracket_depth += 1
-            if in_field:
-                current_field += char
-            else:
-                current_value += char
-        elif char == '}':
+        elif char in ']}':
             bracket_depth -= 1
+        elif bracket_depth != 0:
+            continue
+        elif char == '=':
             if in_field:
-                current_field += char
-            else:
-                current_value += char
-        elif char == '=' and bracket_depth == 0 and in_field:
-            in_field = False
-        elif char == ',' and bracket_depth == 0:
+                field_end = match.start()
+                value_start = match.end()
+                in_field = False
+        else:
             # End of field-value pair
-            field_name = current_field.strip()
-            if field_name:
-                fields[field_name] = parse_value_recursive(current_value.strip())
-            current_field = ""
-            current_value = ""
+            _add_pair(pairs, content, field_start, field_end, value_start, match.start(), in_field)
+            field_start = match.end()
             in_field = True
-        else:
-            if in_field:
-                current_field += char
-            else:
-                current_value += char
-        
-        i += 1
     
     # Don't forget the last field
-    field_name = current_field.strip()
-    if field_name:
-        fields[field_name] = parse_value_recursive(current_value.strip())
+    _add_pair(pairs, content, field_start, field_end, value_start, len(content), in_field)
     
-    return fields
+    return pairs
 
 
-def parse_array_items(content: str) -> List[Any]:
-    """
-    Parse array items from content string.
-    
-    Args:
-        content: String containing array items
-        
-    Returns:
-        List of parsed items
-    """
+def _add_pair(pairs: List[Tuple[str, str]], content: str, field_start: int, field_end: int,
+              value_start: int, end: int, in_field: bool) -> None:
+    """Slice one field=value pair out of content; pairs without a name are dropped."""
+    if in_field:
+        # No '=' seen: the whole segment is the field name and the value is empty
+        field_name = content[field_start:end].strip()
+        value = ''
+    else:
+        field_name = content[field_start:field_end].strip()
+        value = content[value_start:end].strip()
+    if field_name:
+        pairs.append((field_name, value))
+
+
+def _split_items_py(content: str) -> List[str]:
+    """Split array content into item strings at top-level commas; empty items are dropped."""
     items = []
     
-    i = 0
-    current_item = ""
+    item_start = 0
     bracket_depth = 0
     
-    while i < len(content):
-        char = content[i]
+    for match in _ARRAY_DELIM_RE.finditer(content):
+        char = match.group()
         
         if char in '[{':
             bracket_depth += 1
-            current_item += char
         elif char in ']}':
             bracket_depth -= 1
-            current_item += char
-        elif char == ',' and bracket_depth == 0:
-            item = current_item.strip()
+        elif bracket_depth == 0:
+            item = content[item_start:match.start()].strip()
             if item:
-                items.append(parse_value_recursive(item))
-            current_item = ""
-        else:
-            current_item += char
-        
-        i += 1
+                items.append(item)
+            item_start = match.end()
     
     # Don't forget the last item
-    item = current_item.strip()
+    item = content[item_start:].strip()
     if item:
-        items.append(parse_value_recursive(item))
+        items.append(item)
     
     return items
 
 
-def parse_map_items(content: str) -> Dict[str, Any]:
+# Use the compiled scanner when it has been built (see _fast_scan.pyx)
+try:
+    from _fast_scan import split_fields as _split_fields, split_items as _split_items
+except ImportError:
+    _split_fields = _split_fields_py
+    _split_items = _split_items_py
+
+
+def parse_fields_from_content(content: str, skip_nulls: bool = False) -> Dict[str, Any]:
+    """
+    Parse field=value pairs from content string, handling nested brackets.
+    
+    Args:
+        content: String containing field=value pairs
+        skip_nulls: Leave out nulls while parsing; the result equals
+            remove_nulls(parse_fields_from_content(content))
+        
+    Returns:
+        Dictionary of field names to parsed values
+    """
+    fields = {}
+    _drain([(fields, _split_fields(content), None)], skip_nulls)
+    return fields
+
+
+def parse_array_items(content: str) -> List[Any]:
     """
-    Parse map items from {key=value, ...} format.
+    Parse array items from content string.
     
     Args:
-        content: String containing map items
+        content: String containing array items
         
     Returns:
-        Dictionary of parsed items
+        List of parsed items
     """
-    return parse_fields_from_content(content)
+    items = []
+    _drain([(items, _split_items(content), None)])
+    return items
+
+
+# Maps ({key=value, ...}) use the same field syntax; kept as an alias for callers
+parse_map_items = parse_fields_from_content
 
 
 def remove_nulls(obj: Any) -> Any:
     """
     Recursively remove null values from a dictionary or list.
     
+    obj is left untouched and a filtered version is returned; containers
+    with nothing to remove are reused rather than rebuilt, so the result
+    shares those subtrees with obj.
+    
     Args:
         obj: Object to filter
         
@@ -258,16 +432,35 @@ def remove_nulls(obj: Any) -> Any:
         Filtered object without null values
     """
     if isinstance(obj, dict):
-        return {
-            k: remove_nulls(v) 
-            for k, v in obj.items() 
-            if v is not None and (not isinstance(v, dict) or v) and (not isinstance(v, list) or v)
-        }
+        filtered = {}
+        changed = False
+        for k, v in obj.items():
+            if _is_droppable(v):
+                changed = True
+                continue
+            filtered_v = remove_nulls(v)
+            changed = changed or filtered_v is not v
+            filtered[k] = filtered_v
+        return filtered if changed else obj
     elif isinstance(obj, list):
-        return [remove_nulls(item) for item in obj if item is not None]
+        filtered = []
+        changed = False
+        for item in obj:
+            if item is None:
+                changed = True
+                continue
+            filtered_item = remove_nulls(item)
+            changed = changed or filtered_item is not item
+            filtered.append(filtered_item)
+        return filtered if changed else obj
     return obj
 
 
+def _is_droppable(value: Any) -> bool:
+    """Dict values removed by remove_nulls: None and empty dicts/lists."""
+    return value is None or (isinstance(value, (dict, list)) and not value)
+
+
 def normalize_status(status: Any) -> str:
     """
     Normalize transaction status to standard values.
@@ -275,22 +468,23 @@ def normalize_status(status: Any) -> str:
     if status is None:
         return 'unknown'
     
-    status_str = str(status).lower()
+    return _normalize_status_str(str(status))
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_status_str(status: str) -> str:
+    """
+    Map a status string to its standard value.
+    Statuses come from a small set of enum values, so results are cached.
+    """
+    status_lower = status.lower()
     
-    if 'succeeded' in status_str or 'success' in status_str:
-        return 'success'
-    elif 'failed' in status_str or 'failure' in status_str:
-        return 'failed'
-    elif 'pending' in status_str:
-        return 'pending'
-    elif 'cancelled' in status_str or 'canceled' in status_str:
-        return 'cancelled'
-    elif 'refunded' in status_str:
-        return 'refunded'
-    elif 'voided' in status_str:
-        return 'voided'
+    # Keywords are in priority order; the first one found wins
+    for keyword, normalized in _STATUS_KEYWORDS:
+        if keyword in status_lower:
+            return normalized
     
-    return str(status)
+    return status
 
 
 def convert_amount(amount: Any) -> float:
@@ -301,6 +495,11 @@ def convert_amount(amount: Any) -> float:
     if amount is None:
         return 0.0
     
+    # The parser yields native ints for amounts, which are always whole numbers
+    if isinstance(amount, int):
+        value = float(amount)
+        return value / 100.0 if abs(amount) >= 100 else value
+    
     try:
         value = float(amount)
         # If it's a whole number >= 100, assume it's in cents
@@ -311,22 +510,64 @@ def convert_amount(amount: Any) -> float:
         return 0.0
 
 
-def parse_transaction_text(text: str) -> Optional[Dict[str, Any]]:
+@dataclass(slots=True)
+class TransactionResult:
+    """
+    Slotted record form of a parsed transaction, for callers holding many
+    results (see parse_transaction_text's as_record flag).
+    
+    Fields the transaction doesn't have, and representations the parse
+    mode didn't build, are None.
+    """
+    transaction_id: Any = None
+    timestamp: Any = None
+    status: Optional[str] = None
+    amount: Optional[float] = None
+    currency: Any = None
+    raw_text: Optional[str] = None
+    json_full: Optional[Dict[str, Any]] = None
+    json_compact: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dict form parse_transaction_text returns by default, leaving out None fields."""
+        result = {}
+        for name in _RESULT_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
+        return result
+
+
+_RESULT_FIELDS = tuple(field.name for field in dataclass_fields(TransactionResult))
+
+
+def parse_transaction_text(text: str, mode: ParseMode = 'full', include_raw: bool = True,
+                           as_record: bool = False) -> Union[Dict[str, Any], TransactionResult, None]:
     """
     Parse a single transaction from text format to JSON format.
     
     Returns a dictionary with:
     - transaction_id, timestamp, status, amount, currency (for display/filtering)
-    - raw_text: Original text as-is
-    - json_full: All parsed fields including nulls
-    - json_compact: Parsed fields with nulls removed
+    - raw_text: Original text as-is (unless include_raw is False)
+    - json_full: All parsed fields including nulls ('full' mode only)
+    - json_compact: Parsed fields with nulls removed ('full' and 'compact' modes)
     
     Args:
         text: The transaction string in Java/Kotlin object format
+        mode: 'full' builds both JSON representations; 'compact' builds only
+            json_compact; 'summary' builds neither and only parses the
+            top-level fields behind the display/filter keys, so nested
+            objects are never constructed
+        include_raw: Keep the original text as raw_text; filter-only callers
+            can drop it so results don't hold on to every input string
+        as_record: Return a TransactionResult instead of a dictionary
         
     Returns:
-        Dictionary with transaction data, or None if parsing fails
+        Dictionary (or TransactionResult) with transaction data, or None if parsing fails
     """
+    if mode not in PARSE_MODES:
+        raise ValueError(f"Unknown parse mode: {mode!r}")
+    
     if not text or not text.strip():
         return None
     
@@ -335,56 +576,95 @@ def parse_transaction_text(text: str) -> Optional[Dict[str, Any]]:
     # Store the raw text
     raw_text = text
     
-    # Parse the Transaction[...] wrapper
-    match = re.match(r'^\s*Transaction\[(.+)\]\s*$', text, re.DOTALL)
-    if not match:
+    # Parse the Transaction[...] wrapper; text is stripped, so a fixed
+    # prefix/suffix check is all the wrapper needs
+    if not (text.startswith('Transaction[') and text.endswith(']')):
         return None
     
-    content = match.group(1)
-    
-    # Parse ALL fields recursively
-    json_full = parse_fields_from_content(content)
-    
-    if not json_full:
-        return None
+    content = text[len('Transaction['):-1]
     
-    # Create compact version without nulls
-    json_compact = remove_nulls(json_full)
+    if mode != 'full':
+        # Split the top level once, but only parse the values we report
+        pairs = _split_fields(content)
+        if not pairs:
+            return None
+        json_full = {}
+        for field_name, value in pairs:
+            if field_name in SUMMARY_FIELDS:
+                json_full[field_name] = parse_value_recursive(value)
+        
+        if mode == 'compact':
+            # Build the compact tree directly, skipping nulls as they're parsed
+            json_compact = {}
+            _drain([(json_compact, pairs, None)], skip_nulls=True)
+    else:
+        # Parse ALL fields recursively
+        json_full = parse_fields_from_content(content)
+        
+        if not json_full:
+            return None
     
     # Extract key fields for the main result (used for display/metrics)
-    result = {}
-    
-    # Transaction ID
-    if 'id' in json_full:
-        result['transaction_id'] = json_full['id']
-    
-    # Timestamp
-    if 'createdAt' in json_full:
-        result['timestamp'] = json_full['createdAt']
-    elif 'updatedAt' in json_full:
-        result['timestamp'] = json_full['updatedAt']
-    
-    # Status (normalized)
-    if 'status' in json_full:
-        result['status'] = normalize_status(json_full['status'])
-    
-    # Amount (converted from cents)
-    if 'amount' in json_full:
-        result['amount'] = convert_amount(json_full['amount'])
-    
-    # Currency
-    if 'currency' in json_full:
-        result['currency'] = json_full['currency']
+    if as_record:
+        result = TransactionResult(
+            transaction_id=json_full.get('id'),
+            timestamp=json_full['createdAt'] if 'createdAt' in json_full else json_full.get('updatedAt'),
+            status=normalize_status(json_full['status']) if 'status' in json_full else None,
+            amount=convert_amount(json_full['amount']) if 'amount' in json_full else None,
+            currency=json_full.get('currency'),
+            raw_text=raw_text if include_raw else None,
+        )
+    else:
+        result = {}
+        
+        # Transaction ID
+        if 'id' in json_full:
+            result['transaction_id'] = json_full['id']
+        
+        # Timestamp
+        if 'createdAt' in json_full:
+            result['timestamp'] = json_full['createdAt']
+        elif 'updatedAt' in json_full:
+            result['timestamp'] = json_full['updatedAt']
+        
+        # Status (normalized)
+        if 'status' in json_full:
+            result['status'] = normalize_status(json_full['status'])
+        
+        # Amount (converted from cents)
+        if 'amount' in json_full:
+            result['amount'] = convert_amount(json_full['amount'])
+        
+        # Currency
+        if 'currency' in json_full:
+            result['currency'] = json_full['currency']
+        
+        if include_raw:
+            result['raw_text'] = raw_text
+    
+    # Add the requested representations
+    if mode == 'summary':
+        return result
+    if mode == 'full':
+        # Compact version without nulls (shares null-free subtrees with json_full)
+        json_compact = remove_nulls(json_full)
+    else:
+        # Only the summary fields were parsed into json_full
+        json_full = None
     
-    # Add the three representations
-    result['raw_text'] = raw_text
-    result['json_full'] = json_full
-    result['json_compact'] = json_compact
+    if as_record:
+        result.json_full = json_full
+        result.json_compact = json_compact
+    else:
+        if json_full is not None:
+            result['json_full'] = json_full
+        result['json_compact'] = json_compact
     
     return result
 
 
-def parse_multiple_transactions(text: str) -> List[Dict[str, Any]]:
+def parse_multiple_transactions(text: str, workers: Optional[int] = None, mode: ParseMode = 'full',
+                                include_raw: bool = True, as_record: bool = False) -> List[Union[Dict[str, Any], TransactionResult]]:
     """
     Parse multiple transactions from text.
     
@@ -394,21 +674,34 @@ def parse_multiple_transactions(text: str) -> List[Dict[str, Any]]:
     
     Args:
         text: String containing one or more transactions
+        workers: If set, batches larger than PARALLEL_THRESHOLD are parsed on
+            a process pool of this size (parsing is CPU-bound pure Python, so
+            threads wouldn't help). Callers must be import-safe for worker
+            processes, i.e. guard their entry point with __main__.
+        mode: Output mode passed to parse_transaction_text
+        include_raw: Whether results keep raw_text (see parse_transaction_text)
+        as_record: Return TransactionResult records instead of dictionaries
         
     Returns:
-        List of parsed transaction dictionaries
+        List of parsed transaction dictionaries (or TransactionResult records)
     """
-    transactions = []
-    
-    # Split by 'Transaction[' to find individual transactions
-    parts = re.split(r'(?=Transaction\[)', text)
+    # Split by 'Transaction[' to find individual transactions; anything
+    # before the first marker can't be a transaction and is dropped
+    pieces = text.split('Transaction[')
+    parts = ['Transaction[' + piece for piece in pieces[1:] if piece.strip()]
+    
+    if workers and workers > 1 and len(parts) > PARALLEL_THRESHOLD:
+        # Larger chunks keep pickling overhead per task low
+        chunksize = max(1, len(parts) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parse = functools.partial(parse_transaction_text, mode=mode, include_raw=include_raw,
+                                      as_record=as_record)
+            results = executor.map(parse, parts, chunksize=chunksize)
+            return [parsed for parsed in results if parsed]
     
+    transactions = []
     for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-        
-        parsed = parse_transaction_text(part)
+        parsed = parse_transaction_text(part, mode, include_raw, as_record)
         if parsed:
             transactions.append(parsed)
     
@@ -417,8 +710,6 @@ def parse_multiple_transactions(text: str) -> List[Dict[str, Any]]:
 
 def main():
     """Test the parser with sample data."""
-    import json
-    
     sample = '''Transaction[type=Optional[transaction], id=2eb38251-7909-4204-9f76-4306738990b2, reconciliationId=1Q7gL6MYhzBJkN54ZIXVSs, merchantAccountId=secure-fields-capture, currency=CAD, amount=1591, status=TransactionStatus [value=authorization_succeeded], authorizedAmount=1591, capturedAmount=0, refundedAmount=0, settledCurrency=JsonNullable[null], settledAmount=0, settled=false, country=JsonNullable[CA], createdAt=2025-12-16T20:23:36.201957Z, updatedAt=2025-12-16T20:23:37.664110Z]'''
     
     result = parse_transaction_text(sample)
@@ -426,9 +717,9 @@ def main():
         print("=== Transaction ID ===")
         print(result.get('transaction_id'))
         print("\n=== JSON Full (with nulls) ===")
-        print(json.dumps(result.get('json_full'), indent=2))
+        print(_dumps(result.get('json_full')))
         print("\n=== JSON Compact (without nulls) ===")
-        print(json.dumps(result.get('json_compact'), indent=2))
+        print(_dumps(result.get('json_compact')))
     else:
         print("Failed to parse transaction")
 